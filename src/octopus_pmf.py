@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import math
+import time
 from collections import defaultdict
 from functools import lru_cache
-from typing import Dict, Tuple, List
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 # ---------- Combinatorics helpers ----------
@@ -255,10 +256,11 @@ def M(ell: int, L: int, R: int, kL: int, kR: int, c: int = 0) -> Dict[int, float
 
 # ---------- Full PMF via Theorem 3 ----------
 
-def pmf_leftfilled(t: int, k: int) -> Dict[int, float]:
+def _leftfilled_terms(t: int, k: int) -> List[Tuple[float, int, Tuple[int, int, int, int, int, int]]]:
+    # One entry per (j, s) contribution: (weight, bottom singles, args of the upper M call)
 
     if not (1 <= k <= t):
-        return {}
+        return []
 
     # h = ceil(log2 t); p = 2^(h-1) for h>=1 (else 1); L = t - p; x = 2L (bottom-layer population)
     h = (t - 1).bit_length()
@@ -266,12 +268,11 @@ def pmf_leftfilled(t: int, k: int) -> Dict[int, float]:
     L = t - p
     x = 2 * L
 
-    pmf: Dict[int, float] = defaultdict(float)
-
     denom = comb(t, k)
     if denom == 0:
-        return {}
+        return []
 
+    terms = []
     # Hypergeometric j = #selected among bottom x leaves
     for j in range(0, min(k, x) + 1):
         wj = comb(x, j) * comb(t - x, k - j) / denom
@@ -289,7 +290,7 @@ def pmf_leftfilled(t: int, k: int) -> Dict[int, float]:
             # Initialize upper process at level h-1:
             # left block size L, right block size (p - L)
             # counts: kL = j - s, kR = k - j; carry c=0
-            upper = M(
+            args = (
                 max(h - 1, 0),
                 L if h > 0 else 0,
                 (p - L) if h > 0 else 0,
@@ -297,9 +298,19 @@ def pmf_leftfilled(t: int, k: int) -> Dict[int, float]:
                 k - j,
                 0,  # start with no constraint at boundary
             )
-            w = wj * ws
-            for m_up, p_up in upper.items():
-                pmf[singles_bottom + m_up] += w * p_up
+            terms.append((wj * ws, singles_bottom, args))
+
+    return terms
+
+
+def pmf_leftfilled(t: int, k: int) -> Dict[int, float]:
+
+    pmf: Dict[int, float] = defaultdict(float)
+
+    for w, singles_bottom, args in _leftfilled_terms(t, k):
+        upper = M(*args)
+        for m_up, p_up in upper.items():
+            pmf[singles_bottom + m_up] += w * p_up
 
     return dict(pmf)
 
@@ -323,3 +334,94 @@ def interleave_cost_table(t: int, k: int) -> List[Tuple[int, float]]:
         if prob > 0:
             table.append((m_max, -math.log2(prob)))
     return table
+
+
+# ---------- Progressive output: (m_max, lower, upper bound on log2 E[work]) ----------
+
+def interleave_cost_bounds(
+    t: int, k: int, chunk: int = 16, deadline: Optional[float] = None
+) -> Iterator[Tuple[float, List[Tuple[int, float, float]]]]:
+    # Yields (remaining mass, [(m_max, lo, hi), ...]) every `chunk` (j, s) terms, heaviest first;
+    # a chunk is cut short once time.monotonic() passes `deadline`
+    if chunk < 1:
+        raise ValueError("chunk must be >= 1.")
+
+    terms = sorted(_leftfilled_terms(t, k), key=lambda x: -x[0])
+    if not terms:
+        return
+
+    # tail[i] = total weight of terms[i:], summed from the small end for accuracy
+    tail = [0.0] * (len(terms) + 1)
+    for i in range(len(terms) - 1, -1, -1):
+        tail[i] = tail[i + 1] + terms[i][0]
+
+    # Each selected leaf adds at most h = ceil(log2 t) path nodes, so m <= k*h
+    m_cap = k * (t - 1).bit_length()
+    pmf: Dict[int, float] = defaultdict(float)
+
+    start = 0
+    while start < len(terms):
+        stop = min(start + chunk, len(terms))
+        for i in range(start, stop):
+            w, singles_bottom, args = terms[i]
+            for m_up, p_up in M(*args).items():
+                pmf[singles_bottom + m_up] += w * p_up
+            if deadline is not None and time.monotonic() >= deadline:
+                stop = i + 1
+                break
+        start = stop
+
+        # Pending mass is keyed by its bottom singles, a lower bound on its final m
+        pending = [0.0] * (m_cap + 1)
+        for w, singles_bottom, _ in terms[stop:]:
+            pending[singles_bottom] += w
+
+        # Once nothing is pending, rows past the largest m reached are redundant
+        m_top = m_cap if stop < len(terms) else max(pmf)
+
+        # Partial CDF bounds the true CDF from below; adding pending mass bounds it from above
+        table: List[Tuple[int, float, float]] = []
+        run = 0.0
+        run_pending = 0.0
+        for m_max in range(m_top + 1):
+            run += pmf.get(m_max, 0.0)
+            run_pending += pending[m_max]
+            upper_cdf = min(run + run_pending, 1.0)
+            if upper_cdf <= 0:
+                continue
+            lo = -math.log2(upper_cdf)
+            hi = -math.log2(run) if run > 0 else math.inf  # inf until mass reaches m_max
+            table.append((m_max, lo, max(hi, lo)))
+
+        yield tail[stop], table
+
+
+def interleave_cost_table_progressive(
+    t: int,
+    k: int,
+    chunk: int = 16,
+    tol: Optional[float] = None,
+    m_max: Optional[Iterable[int]] = None,
+    time_budget: Optional[float] = None,
+    callback: Optional[Callable[[float, List[Tuple[int, float, float]]], Optional[bool]]] = None,
+) -> List[Tuple[int, float, float]]:
+    # Stops once done, once callback returns True, once time_budget (seconds) runs out,
+    # or once hi - lo <= tol on every row in m_max
+    if tol is not None and m_max is None:
+        raise ValueError("tol needs the m_max values it applies to.")
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    watch = set(m_max) if m_max is not None else set()
+
+    table: List[Tuple[int, float, float]] = []
+    for remaining, table in interleave_cost_bounds(t, k, chunk, deadline):
+        if callback is not None and callback(remaining, table):
+            break
+        if remaining <= 0:
+            break
+        if tol is not None:
+            rows = [(lo, hi) for m, lo, hi in table if m in watch]
+            if len(rows) == len(watch) and all(hi - lo <= tol for lo, hi in rows):
+                break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    return table
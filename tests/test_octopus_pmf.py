@@ -0,0 +1,84 @@
+import pytest
+
+from src.octopus_pmf import (
+    M,
+    interleave_cost_bounds,
+    interleave_cost_table,
+    interleave_cost_table_progressive,
+)
+
+CASES = [(1, 1), (5, 5), (8, 2), (100, 9), (272, 17), (300, 40), (8704, 17)]
+
+
+@pytest.mark.parametrize("t,k", CASES)
+def test_bounds_contain_exact_cost(t, k):
+    exact = dict(interleave_cost_table(t, k))
+    snapshots = list(interleave_cost_bounds(t, k, chunk=3))
+    assert snapshots
+
+    remaining = [r for r, _ in snapshots]
+    assert remaining == sorted(remaining, reverse=True)
+    assert remaining[-1] == 0.0
+
+    for _, table in snapshots:
+        for m_max, lo, hi in table:
+            assert lo <= hi
+            if m_max in exact:
+                assert lo - 1e-9 <= exact[m_max] <= hi + 1e-9
+        assert set(exact) <= {m for m, _, _ in table}
+
+    final = snapshots[-1][1]
+    assert [m for m, _, _ in final] == sorted(exact)
+    for m_max, lo, hi in final:
+        assert lo == pytest.approx(exact[m_max], abs=1e-9)
+        assert hi == pytest.approx(exact[m_max], abs=1e-9)
+
+
+def test_early_snapshot_covers_every_m_max():
+    _, table = next(interleave_cost_bounds(272, 17, chunk=1))
+    exact = dict(interleave_cost_table(272, 17))
+    assert set(exact) <= {m for m, _, _ in table}
+
+
+def test_tol_stops_early():
+    total = len(list(interleave_cost_bounds(8704, 17, chunk=4)))
+    seen = []
+    table = interleave_cost_table_progressive(
+        8704, 17, chunk=4, tol=1e-6, m_max=[118], callback=lambda r, tab: seen.append(r)
+    )
+    assert len(seen) < total
+    lo, hi = {m: (lo, hi) for m, lo, hi in table}[118]
+    assert hi - lo <= 1e-6
+    assert lo - 1e-9 <= dict(interleave_cost_table(8704, 17))[118] <= hi + 1e-9
+
+
+def test_tol_needs_m_max():
+    with pytest.raises(ValueError):
+        interleave_cost_table_progressive(272, 17, tol=1e-6)
+
+
+def test_callback_stops_early():
+    seen = []
+
+    def stop_after_two(remaining, table):
+        seen.append(remaining)
+        return len(seen) == 2
+
+    interleave_cost_table_progressive(8704, 17, chunk=4, callback=stop_after_two)
+    assert len(seen) == 2
+    assert seen[-1] > 0
+
+
+def test_time_budget_cuts_chunk_short():
+    M.cache_clear()
+    seen = []
+    interleave_cost_table_progressive(
+        8704, 17, chunk=1000, time_budget=0, callback=lambda r, tab: seen.append(r)
+    )
+    assert len(seen) == 1
+    assert seen[0] > 0
+
+
+def test_invalid_chunk():
+    with pytest.raises(ValueError):
+        next(interleave_cost_bounds(272, 17, chunk=0))